@@ -9,18 +9,12 @@ Contributed Code
     This code makes no guarantee about maintaining backwards compatibility.
 """
 
-from pyro.contrib import (
-    autoname,
-    bnn,
-    easyguide,
-    epidemiology,
-    forecast,
-    gp,
-    oed,
-    tracking,
-)
+from importlib import import_module as _import_module
+from importlib.util import find_spec as _find_spec
 
-__all__ = [
+# Submodules are imported lazily on first attribute access, so that importing
+# a single submodule does not pay for importing all others.
+_SUBMODULES = (
     "autoname",
     "bnn",
     "easyguide",
@@ -29,14 +23,37 @@ __all__ = [
     "gp",
     "oed",
     "tracking",
-]
-
-
-try:
-    import funsor as funsor_  # noqa: F401
-
-    from pyro.contrib import funsor
+)
 
-    __all__ += ["funsor"]
-except ImportError:
-    pass
+# None until pyro.contrib.funsor has been tried, then whether it imported.
+_funsor_ok = None
+
+
+def _has_funsor():
+    global _funsor_ok
+    if _funsor_ok is None:
+        _funsor_ok = False
+        if _find_spec("funsor") is not None:
+            try:
+                _import_module("pyro.contrib.funsor")
+                _funsor_ok = True
+            except ImportError:
+                pass
+    return _funsor_ok
+
+
+def __getattr__(name):
+    if name == "__all__":
+        # Computed on demand so that "funsor" is only listed once
+        # pyro.contrib.funsor is known to import.
+        return list(_SUBMODULES) + (["funsor"] if _has_funsor() else [])
+    if name in _SUBMODULES:
+        return _import_module("pyro.contrib." + name)
+    if name == "funsor" and _has_funsor():
+        return _import_module("pyro.contrib.funsor")
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    names = [n for n in globals() if n.startswith("__") or not n.startswith("_")]
+    return sorted(set(names) | set(__getattr__("__all__")))
@@ -0,0 +1,59 @@
+# Copyright Contributors to the Pyro project.
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+from subprocess import check_call
+
+# Each script runs in a subprocess so that sys.modules starts clean.
+LAZY_SCRIPT = """
+import sys
+import types
+
+import pyro.contrib
+
+assert "pyro.contrib.gp" not in sys.modules
+assert "pyro.contrib.epidemiology" not in sys.modules
+
+gp = pyro.contrib.gp
+assert isinstance(gp, types.ModuleType)
+assert gp is sys.modules["pyro.contrib.gp"]
+
+try:
+    pyro.contrib.does_not_exist
+except AttributeError:
+    pass
+else:
+    raise AssertionError("expected AttributeError")
+
+assert "import_module" not in dir(pyro.contrib)
+assert "find_spec" not in dir(pyro.contrib)
+
+namespace = {}
+exec("from pyro.contrib import *", namespace)
+for name in pyro.contrib.__all__:
+    assert isinstance(namespace[name], types.ModuleType), name
+"""
+
+BROKEN_FUNSOR_SCRIPT = """
+import sys
+
+# Make pyro.contrib.funsor fail to import, even if funsor is installed.
+sys.modules["pyro.contrib.funsor"] = None
+
+import pyro.contrib
+
+namespace = {}
+exec("from pyro.contrib import *", namespace)
+assert "funsor" not in namespace
+assert "funsor" not in pyro.contrib.__all__
+assert hasattr(pyro.contrib, "funsor") is False
+assert "funsor" not in dir(pyro.contrib)
+"""
+
+
+def test_lazy_import():
+    check_call([sys.executable, "-c", LAZY_SCRIPT])
+
+
+def test_broken_funsor_import():
+    check_call([sys.executable, "-c", BROKEN_FUNSOR_SCRIPT])